@@ -11,47 +11,112 @@ Version: 1.0.0
 
 import json
 import os
+import sys
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+def _load_json(path) -> Any:
+    """Parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# ANSI clear screen + cursor home, understood by any VT100-compatible terminal
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Result statuses counted as failures
+_FAIL_SET = frozenset(('FAIL', 'ERROR'))
+
+# Save time encoded in report file names: qa_report_<YYYYmmdd_HHMMSS>.json
+REPORT_NAME_TIME_FORMAT = "%Y%m%d_%H%M%S"
+# Report timestamps are compared as strings on their "YYYY-MM-DDTHH:MM:SS" prefix
+ISO_SECONDS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+ISO_SECONDS_LEN = 19
+
+def _name_older_than(name: str, cutoff_name: str) -> bool:
+    """Whether a qa_report_<time>.json file name was saved before the cutoff.
+    
+    A report is saved after its timestamp is taken, so a file saved before the
+    cutoff cannot hold a report inside the window. Names without an encoded
+    save time are never skipped.
+    """
+    stamp = name[len("qa_report_"):-len(".json")]
+    if len(stamp) != 15 or stamp[8] != "_" or not (stamp[:8] + stamp[9:]).isdigit():
+        return False
+    return stamp < cutoff_name
+
 class QADashboard:
     """QA Dashboard for monitoring test results and trends"""
     
     def __init__(self, qa_root: str):
         self.qa_root = Path(qa_root)
         self.reports_dir = self.qa_root / "reports"
+        # Parsed reports keyed by path, with the mtime they were parsed at
+        self._cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         
     def load_reports(self, days: int = 7) -> List[Dict[str, Any]]:
         """Load QA reports from the last N days"""
         reports = []
         cutoff_date = datetime.now() - timedelta(days=days)
+        # ISO timestamps sort lexically, so the window check is a plain string
+        # comparison on the fixed-width seconds prefix (ignores fractions and tz suffixes)
+        cutoff_iso = cutoff_date.strftime(ISO_SECONDS_FORMAT)
+        cutoff_name = cutoff_date.strftime(REPORT_NAME_TIME_FORMAT)
         
-        if not self.reports_dir.exists():
+        # Opening the directory doubles as the existence check
+        try:
+            with os.scandir(self.reports_dir) as entries:
+                report_entries = [entry for entry in entries
+                                  if entry.name.startswith("qa_report_") and entry.name.endswith(".json")
+                                  and not _name_older_than(entry.name, cutoff_name)]
+        except FileNotFoundError:
+            self._cache = {}
             return reports
         
-        for report_file in self.reports_dir.glob("qa_report_*.json"):
+        # Re-parse only files that are new or changed since the last call
+        cache = {}
+        for entry in report_entries:
+            report_file = entry.path
             try:
-                with open(report_file, 'r') as f:
-                    report = json.load(f)
+                mtime = entry.stat().st_mtime_ns
+                cached = self._cache.get(report_file)
+                if cached is not None and cached[0] == mtime:
+                    report = cached[1]
+                else:
+                    report = _load_json(report_file)
+                cache[report_file] = (mtime, report)
                 
-                # Parse timestamp
-                report_time = datetime.fromisoformat(report['timestamp'].replace('Z', '+00:00'))
-                if report_time.replace(tzinfo=None) >= cutoff_date:
+                if report['timestamp'][:ISO_SECONDS_LEN] >= cutoff_iso:
                     reports.append(report)
             except Exception as e:
                 print(f"Warning: Could not load report {report_file}: {e}")
+        # Drop entries for files that were removed or fell out of the scan
+        self._cache = cache
         
         # Sort by timestamp
         reports.sort(key=lambda x: x['timestamp'], reverse=True)
         return reports
     
-    def get_latest_report(self) -> Dict[str, Any]:
-        """Get the most recent QA report"""
-        reports = self.load_reports(days=1)
-        return reports[0] if reports else {}
+    def get_latest_report(self, reports: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Get the most recent QA report from the last day.
+        
+        Pass already loaded reports (newest first, covering at least one day)
+        to pick from them instead of scanning the reports directory again.
+        """
+        if reports is None:
+            reports = self.load_reports(days=1)
+        if not reports:
+            return {}
+        cutoff_iso = (datetime.now() - timedelta(days=1)).strftime(ISO_SECONDS_FORMAT)
+        return reports[0] if reports[0]['timestamp'][:ISO_SECONDS_LEN] >= cutoff_iso else {}
     
     def calculate_trends(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate trends from historical reports"""
@@ -78,106 +143,123 @@ class QADashboard:
             trend = "stable"
         
         # Performance trends
-        startup_times = []
+        # Running sum/count plus the most recent sample; no per-sample list is kept
+        startup_current = None
+        startup_total = 0.0
+        startup_samples = 0
         for report in reports:
             for result in report.get('results', []):
                 if result['name'] == 'Startup Performance' and result['status'] == 'PASS':
-                    startup_times.append(result.get('details', {}).get('average_startup', 0))
+                    startup_time = result.get('details', {}).get('average_startup', 0)
+                    if startup_current is None:
+                        startup_current = startup_time
+                    startup_total += startup_time
+                    startup_samples += 1
         
         trends.update({
             "trend": trend,
             "pass_rate_current": pass_rates[0] if pass_rates else 0,
             "pass_rate_average": sum(pass_rates) / len(pass_rates) if pass_rates else 0,
-            "startup_time_current": startup_times[0] if startup_times else 0,
-            "startup_time_average": sum(startup_times) / len(startup_times) if startup_times else 0,
+            "startup_time_current": startup_current if startup_samples else 0,
+            "startup_time_average": startup_total / startup_samples if startup_samples else 0,
         })
         
         return trends
     
     def generate_dashboard_text(self) -> str:
         """Generate text-based dashboard"""
-        latest_report = self.get_latest_report()
         reports = self.load_reports(days=7)
+        latest_report = self.get_latest_report(reports)
         trends = self.calculate_trends(reports)
         
         if not latest_report:
             return "❌ No QA reports found. Run QA tests first."
         
+        parts: List[str] = []
+        add = parts.append
+        
+        # Collect everything needed from the latest results in one pass
+        startup_result = None
+        failed_tests = []
+        clippy_failed = False
+        for result in latest_report.get('results', ()):
+            name = result['name']
+            status = result['status']
+            if name == 'Startup Performance' and startup_result is None:
+                startup_result = result
+            if status in _FAIL_SET:
+                failed_tests.append(result)
+                if name == 'Code Quality (Clippy)' and status == 'FAIL':
+                    clippy_failed = True
+        
         # Header
-        dashboard = "🔍 DATTAVANI ASR QA DASHBOARD\n"
-        dashboard += "=" * 50 + "\n\n"
+        add("🔍 DATTAVANI ASR QA DASHBOARD\n")
+        add("=" * 50 + "\n\n")
         
         # Current Status
         status_icon = "✅" if latest_report.get('summary', {}).get('overall_status') == 'PASS' else "❌"
-        dashboard += f"📊 CURRENT STATUS: {status_icon} {latest_report.get('summary', {}).get('overall_status', 'UNKNOWN')}\n"
-        dashboard += f"📅 Last Run: {latest_report.get('timestamp', 'Unknown')[:19]}\n"
-        dashboard += f"⏱️  Duration: {latest_report.get('duration', 0):.2f}s\n\n"
+        add(f"📊 CURRENT STATUS: {status_icon} {latest_report.get('summary', {}).get('overall_status', 'UNKNOWN')}\n")
+        add(f"📅 Last Run: {latest_report.get('timestamp', 'Unknown')[:19]}\n")
+        add(f"⏱️  Duration: {latest_report.get('duration', 0):.2f}s\n\n")
         
         # Test Results Summary
-        dashboard += "🧪 TEST RESULTS\n"
-        dashboard += "-" * 20 + "\n"
-        dashboard += f"Total Tests: {latest_report.get('total_tests', 0)}\n"
-        dashboard += f"✅ Passed: {latest_report.get('passed', 0)}\n"
-        dashboard += f"❌ Failed: {latest_report.get('failed', 0)}\n"
-        dashboard += f"⏭️  Skipped: {latest_report.get('skipped', 0)}\n"
-        dashboard += f"🔥 Errors: {latest_report.get('errors', 0)}\n"
+        add("🧪 TEST RESULTS\n")
+        add("-" * 20 + "\n")
+        add(f"Total Tests: {latest_report.get('total_tests', 0)}\n")
+        add(f"✅ Passed: {latest_report.get('passed', 0)}\n")
+        add(f"❌ Failed: {latest_report.get('failed', 0)}\n")
+        add(f"⏭️  Skipped: {latest_report.get('skipped', 0)}\n")
+        add(f"🔥 Errors: {latest_report.get('errors', 0)}\n")
         
         pass_rate = latest_report.get('passed', 0) / max(1, latest_report.get('total_tests', 1))
-        dashboard += f"📈 Pass Rate: {pass_rate:.1%}\n\n"
+        add(f"📈 Pass Rate: {pass_rate:.1%}\n\n")
         
         # Performance Metrics
-        dashboard += "⚡ PERFORMANCE\n"
-        dashboard += "-" * 20 + "\n"
-        
-        startup_result = None
-        for result in latest_report.get('results', []):
-            if result['name'] == 'Startup Performance':
-                startup_result = result
-                break
+        add("⚡ PERFORMANCE\n")
+        add("-" * 20 + "\n")
         
         if startup_result and startup_result['status'] == 'PASS':
             startup_time = startup_result.get('details', {}).get('average_startup', 0)
-            dashboard += f"🚀 Startup Time: {startup_time:.3f}s\n"
+            add(f"🚀 Startup Time: {startup_time:.3f}s\n")
             
             if startup_time < 0.1:
-                dashboard += "   Rating: ⭐⭐⭐⭐⭐ EXCELLENT\n"
+                add("   Rating: ⭐⭐⭐⭐⭐ EXCELLENT\n")
             elif startup_time < 1.0:
-                dashboard += "   Rating: ⭐⭐⭐⭐ VERY GOOD\n"
+                add("   Rating: ⭐⭐⭐⭐ VERY GOOD\n")
             elif startup_time < 3.0:
-                dashboard += "   Rating: ⭐⭐⭐ GOOD\n"
+                add("   Rating: ⭐⭐⭐ GOOD\n")
             else:
-                dashboard += "   Rating: ⭐⭐ NEEDS IMPROVEMENT\n"
+                add("   Rating: ⭐⭐ NEEDS IMPROVEMENT\n")
         else:
-            dashboard += "🚀 Startup Time: Not measured\n"
+            add("🚀 Startup Time: Not measured\n")
         
         # Binary Info
         binary_size = latest_report.get('summary', {}).get('binary_size_mb', 0)
-        dashboard += f"📦 Binary Size: {binary_size:.1f} MB\n\n"
+        add(f"📦 Binary Size: {binary_size:.1f} MB\n\n")
         
         # Trends
-        dashboard += "📈 TRENDS (7 days)\n"
-        dashboard += "-" * 20 + "\n"
-        dashboard += f"📊 Trend: {trends['trend'].upper()}\n"
-        dashboard += f"📋 Reports: {trends['total_reports']}\n"
+        add("📈 TRENDS (7 days)\n")
+        add("-" * 20 + "\n")
+        add(f"📊 Trend: {trends['trend'].upper()}\n")
+        add(f"📋 Reports: {trends['total_reports']}\n")
         
         if trends['pass_rate_current'] > 0:
-            dashboard += f"✅ Current Pass Rate: {trends['pass_rate_current']:.1%}\n"
-            dashboard += f"📊 Average Pass Rate: {trends['pass_rate_average']:.1%}\n"
+            add(f"✅ Current Pass Rate: {trends['pass_rate_current']:.1%}\n")
+            add(f"📊 Average Pass Rate: {trends['pass_rate_average']:.1%}\n")
         
         # Recent Failures
-        dashboard += "\n🔍 RECENT ISSUES\n"
-        dashboard += "-" * 20 + "\n"
+        add("\n🔍 RECENT ISSUES\n")
+        add("-" * 20 + "\n")
         
-        failed_tests = [r for r in latest_report.get('results', []) if r['status'] in ['FAIL', 'ERROR']]
         if failed_tests:
             for test in failed_tests:
-                dashboard += f"❌ {test['name']}: {test['message']}\n"
+                add(f"❌ {test['name']}: {test['message']}\n")
         else:
-            dashboard += "✅ No recent failures\n"
+            add("✅ No recent failures\n")
         
         # Recommendations
-        dashboard += "\n💡 RECOMMENDATIONS\n"
-        dashboard += "-" * 20 + "\n"
+        add("\n💡 RECOMMENDATIONS\n")
+        add("-" * 20 + "\n")
         
         recommendations = []
         
@@ -187,8 +269,6 @@ class QADashboard:
         if pass_rate < 0.9:
             recommendations.append("📈 Improve test pass rate")
         
-        clippy_failed = any(r['name'] == 'Code Quality (Clippy)' and r['status'] == 'FAIL' 
-                           for r in latest_report.get('results', []))
         if clippy_failed:
             recommendations.append("🧹 Clean up code quality warnings")
         
@@ -196,22 +276,27 @@ class QADashboard:
             recommendations.append("✨ All systems looking good!")
         
         for rec in recommendations:
-            dashboard += f"{rec}\n"
+            add(f"{rec}\n")
         
-        dashboard += "\n" + "=" * 50 + "\n"
-        dashboard += f"🤖 Generated by QA Dashboard at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        add("\n" + "=" * 50 + "\n")
+        add(f"🤖 Generated by QA Dashboard at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
-        return dashboard
+        return "".join(parts)
     
     def watch_mode(self, interval: int = 30):
         """Run dashboard in watch mode with auto-refresh"""
         try:
             while True:
-                # Clear screen (works on most terminals)
-                os.system('clear' if os.name == 'posix' else 'cls')
+                # Clear screen; legacy Windows consoles may not handle ANSI escapes
+                if os.name == 'nt':
+                    os.system('cls')
+                    clear = ""
+                else:
+                    clear = _CLEAR_SCREEN
                 
-                print(self.generate_dashboard_text())
-                print(f"\n🔄 Auto-refreshing every {interval}s... (Ctrl+C to exit)")
+                sys.stdout.write(f"{clear}{self.generate_dashboard_text()}\n"
+                                 f"\n🔄 Auto-refreshing every {interval}s... (Ctrl+C to exit)\n")
+                sys.stdout.flush()
                 
                 time.sleep(interval)
         except KeyboardInterrupt:
@@ -219,8 +304,12 @@ class QADashboard:
     
     def export_metrics(self, format: str = "json") -> str:
         """Export metrics for external monitoring systems"""
-        latest_report = self.get_latest_report()
+        return self.export_metrics_bytes(format).decode()
+    
+    def export_metrics_bytes(self, format: str = "json") -> bytes:
+        """Export metrics as UTF-8 encoded bytes, ready to write to a file"""
         reports = self.load_reports(days=30)
+        latest_report = self.get_latest_report(reports)
         trends = self.calculate_trends(reports)
         
         metrics = {
@@ -242,7 +331,9 @@ class QADashboard:
                 break
         
         if format == "json":
-            return json.dumps(metrics, indent=2)
+            if orjson is not None:
+                return orjson.dumps(metrics, option=orjson.OPT_INDENT_2)
+            return json.dumps(metrics, indent=2).encode()
         elif format == "prometheus":
             # Prometheus format
             prom_metrics = []
@@ -253,9 +344,9 @@ class QADashboard:
             prom_metrics.append(f'dattavani_asr_binary_size_mb {metrics["binary_size_mb"]}')
             if "startup_time" in metrics:
                 prom_metrics.append(f'dattavani_asr_startup_time_seconds {metrics["startup_time"]}')
-            return "\n".join(prom_metrics)
+            return "\n".join(prom_metrics).encode()
         
-        return str(metrics)
+        return str(metrics).encode()
 
 def main():
     """Main entry point for QA dashboard"""
@@ -271,13 +362,13 @@ def main():
     dashboard = QADashboard(args.qa_root)
     
     if args.export:
-        metrics = dashboard.export_metrics(args.export)
+        metrics = dashboard.export_metrics_bytes(args.export)
         if args.output:
-            with open(args.output, 'w') as f:
+            with open(args.output, 'wb') as f:
                 f.write(metrics)
             print(f"Metrics exported to {args.output}")
         else:
-            print(metrics)
+            print(metrics.decode())
     elif args.watch:
         dashboard.watch_mode(args.interval)
     else:
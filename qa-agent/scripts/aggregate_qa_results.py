@@ -8,28 +8,90 @@ Aggregates QA results from multiple test runs and generates a summary report.
 import json
 import sys
 import os
-from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+def _load_json(path) -> Any:
+    """Parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Status emoji
+STATUS_EMOJI = {
+    "PASS": "✅",
+    "PASS_WITH_WARNINGS": "⚠️",
+    "FAIL": "❌",
+    "ERROR": "🔥",
+    "NO_REPORTS": "❓"
+}
+
+# Closing recommendation per overall status
+STATUS_RECOMMENDATIONS = {
+    "PASS": "✨ All QA checks passed! The code is ready for deployment.\n",
+    "PASS_WITH_WARNINGS": "⚠️ QA passed with warnings. Consider addressing the failing tests before deployment.\n",
+    "FAIL": "❌ QA checks failed. Please fix the failing tests before merging.\n",
+    "ERROR": "🔥 QA encountered errors. Please check the test configuration and environment.\n",
+    "NO_REPORTS": "❓ No QA reports found. Please ensure QA tests are running properly.\n"
+}
+
+# Result statuses counted as failures
+_FAIL_SET = frozenset(('FAIL', 'ERROR'))
+
+def _scan_json(root: str) -> Iterator[str]:
+    """Recursively yield paths of QA report JSON files under root.
+    
+    Directories that cannot be opened are skipped, as rglob does.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_json(entry.path)
+            elif entry.name.endswith('.json') and 'qa-report' in entry.name and entry.is_file():
+                yield entry.path
+
+# Below this many files, a thread pool costs more than it saves
+PARALLEL_LOAD_MIN_FILES = 8
+
+def _load_one(report_file: str) -> Optional[Dict[str, Any]]:
+    """Load a single QA report, returning None if it cannot be parsed"""
+    try:
+        report = _load_json(report_file)
+        report['source_file'] = report_file
+        return report
+    except Exception as e:
+        print(f"Warning: Could not load {report_file}: {e}", file=sys.stderr)
+        return None
 
 def load_qa_reports(reports_dir: str) -> List[Dict[str, Any]]:
     """Load all QA reports from the reports directory"""
     reports = []
-    reports_path = Path(reports_dir)
     
-    if not reports_path.exists():
+    if not os.path.isdir(reports_dir):
         return reports
     
-    # Find all QA report files
-    for report_file in reports_path.rglob("*.json"):
-        if "qa-report" in report_file.name:
-            try:
-                with open(report_file, 'r') as f:
-                    report = json.load(f)
-                    report['source_file'] = str(report_file)
-                    reports.append(report)
-            except Exception as e:
-                print(f"Warning: Could not load {report_file}: {e}", file=sys.stderr)
+    # Find all QA report files, then read and parse them concurrently
+    report_files = list(_scan_json(reports_dir))
+    if len(report_files) < PARALLEL_LOAD_MIN_FILES:
+        loaded = map(_load_one, report_files)
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            loaded = list(executor.map(_load_one, report_files))
+    
+    reports.extend(report for report in loaded if report is not None)
     
     return reports
 
@@ -42,13 +104,43 @@ def aggregate_results(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
             "summary": "No QA reports found"
         }
     
-    # Aggregate metrics
+    # Aggregate metrics, failure counts and performance samples in one pass over the reports
     total_runs = len(reports)
-    total_tests = sum(r.get('total_tests', 0) for r in reports)
-    total_passed = sum(r.get('passed', 0) for r in reports)
-    total_failed = sum(r.get('failed', 0) for r in reports)
-    total_skipped = sum(r.get('skipped', 0) for r in reports)
-    total_errors = sum(r.get('errors', 0) for r in reports)
+    total_tests = total_passed = total_failed = total_skipped = total_errors = 0
+    failure_counts = Counter()
+    # Running sums/counts for the performance averages; no per-sample lists are kept
+    startup_total = 0.0
+    startup_samples = 0
+    binary_total = 0.0
+    binary_samples = 0
+    platforms = set()
+    platforms_add = platforms.add
+    
+    for report in reports:
+        r_get = report.get
+        total_tests += r_get('total_tests', 0)
+        total_passed += r_get('passed', 0)
+        total_failed += r_get('failed', 0)
+        total_skipped += r_get('skipped', 0)
+        total_errors += r_get('errors', 0)
+        
+        # Performance metrics and common failures in one pass over the results
+        for result in r_get('results', ()):
+            name = result['name']
+            status = result['status']
+            if name == 'Startup Performance' and status == 'PASS':
+                details = result.get('details', {})
+                if 'average_startup' in details:
+                    startup_total += details['average_startup']
+                    startup_samples += 1
+            elif status in _FAIL_SET:
+                failure_counts[name] += 1
+        
+        summary = r_get('summary', {})
+        if 'binary_size_mb' in summary:
+            binary_total += summary['binary_size_mb']
+            binary_samples += 1
+        platforms_add(summary.get('platform', 'unknown'))
     
     # Calculate overall pass rate
     overall_pass_rate = total_passed / max(1, total_tests)
@@ -64,28 +156,6 @@ def aggregate_results(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
     else:
         status = "PASS"
     
-    # Find common failures
-    failure_counts = {}
-    for report in reports:
-        for result in report.get('results', []):
-            if result['status'] in ['FAIL', 'ERROR']:
-                test_name = result['name']
-                failure_counts[test_name] = failure_counts.get(test_name, 0) + 1
-    
-    # Performance metrics
-    startup_times = []
-    binary_sizes = []
-    for report in reports:
-        for result in report.get('results', []):
-            if result['name'] == 'Startup Performance' and result['status'] == 'PASS':
-                details = result.get('details', {})
-                if 'average_startup' in details:
-                    startup_times.append(details['average_startup'])
-        
-        summary = report.get('summary', {})
-        if 'binary_size_mb' in summary:
-            binary_sizes.append(summary['binary_size_mb'])
-    
     return {
         "status": status,
         "timestamp": datetime.now().isoformat(),
@@ -96,30 +166,26 @@ def aggregate_results(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
         "total_skipped": total_skipped,
         "total_errors": total_errors,
         "overall_pass_rate": overall_pass_rate,
-        "common_failures": dict(sorted(failure_counts.items(), key=lambda x: x[1], reverse=True)),
+        "common_failures": dict(failure_counts.most_common()),
         "performance": {
-            "avg_startup_time": sum(startup_times) / len(startup_times) if startup_times else 0,
-            "avg_binary_size_mb": sum(binary_sizes) / len(binary_sizes) if binary_sizes else 0,
-            "startup_samples": len(startup_times),
-            "binary_samples": len(binary_sizes)
+            "avg_startup_time": startup_total / startup_samples if startup_samples else 0,
+            "avg_binary_size_mb": binary_total / binary_samples if binary_samples else 0,
+            "startup_samples": startup_samples,
+            "binary_samples": binary_samples
         },
-        "platforms_tested": list(set(r.get('summary', {}).get('platform', 'unknown') for r in reports))
+        "platforms_tested": list(platforms)
     }
 
 def generate_markdown_report(aggregated: Dict[str, Any]) -> str:
     """Generate a markdown report from aggregated results"""
     status = aggregated['status']
     
-    # Status emoji
-    status_emoji = {
-        "PASS": "✅",
-        "PASS_WITH_WARNINGS": "⚠️",
-        "FAIL": "❌",
-        "ERROR": "🔥",
-        "NO_REPORTS": "❓"
-    }.get(status, "❓")
+    status_emoji = STATUS_EMOJI.get(status, "❓")
     
-    report = f"""# QA Aggregation Report
+    parts: List[str] = []
+    add = parts.append
+    
+    add(f"""# QA Aggregation Report
 
 ## {status_emoji} Overall Status: {status}
 
@@ -137,12 +203,12 @@ def generate_markdown_report(aggregated: Dict[str, Any]) -> str:
 | ⏭️ Skipped | {aggregated['total_skipped']} |
 | 🔥 Errors | {aggregated['total_errors']} |
 
-"""
+""")
 
     # Performance section
     perf = aggregated['performance']
     if perf['startup_samples'] > 0:
-        report += f"""## ⚡ Performance Metrics
+        add(f"""## ⚡ Performance Metrics
 
 | Metric | Value |
 |--------|-------|
@@ -150,39 +216,32 @@ def generate_markdown_report(aggregated: Dict[str, Any]) -> str:
 | Average Binary Size | {perf['avg_binary_size_mb']:.1f} MB |
 | Performance Samples | {perf['startup_samples']} |
 
-"""
+""")
 
     # Common failures
     if aggregated['common_failures']:
-        report += "## 🔍 Common Failures\n\n"
-        for test_name, count in list(aggregated['common_failures'].items())[:5]:
-            report += f"- **{test_name}**: Failed in {count}/{aggregated['total_runs']} runs\n"
-        report += "\n"
+        add("## 🔍 Common Failures\n\n")
+        # Partial selection of the top five; ties keep first-seen order
+        top_failures = nlargest(5, aggregated['common_failures'].items(), key=itemgetter(1))
+        for test_name, count in top_failures:
+            add(f"- **{test_name}**: Failed in {count}/{aggregated['total_runs']} runs\n")
+        add("\n")
 
     # Platforms tested
     if aggregated['platforms_tested']:
         platforms = [p for p in aggregated['platforms_tested'] if p != 'unknown']
         if platforms:
-            report += f"## 🖥️ Platforms Tested\n\n"
+            add(f"## 🖥️ Platforms Tested\n\n")
             for platform in platforms:
-                report += f"- {platform}\n"
-            report += "\n"
+                add(f"- {platform}\n")
+            add("\n")
 
     # Recommendations
-    report += "## 💡 Recommendations\n\n"
-    
-    if status == "PASS":
-        report += "✨ All QA checks passed! The code is ready for deployment.\n"
-    elif status == "PASS_WITH_WARNINGS":
-        report += "⚠️ QA passed with warnings. Consider addressing the failing tests before deployment.\n"
-    elif status == "FAIL":
-        report += "❌ QA checks failed. Please fix the failing tests before merging.\n"
-    elif status == "ERROR":
-        report += "🔥 QA encountered errors. Please check the test configuration and environment.\n"
-    else:
-        report += "❓ No QA reports found. Please ensure QA tests are running properly.\n"
+    add("## 💡 Recommendations\n\n")
+    
+    add(STATUS_RECOMMENDATIONS.get(status, STATUS_RECOMMENDATIONS["NO_REPORTS"]))
 
-    return report
+    return "".join(parts)
 
 def main():
     """Main entry point"""
@@ -6,91 +6,149 @@ Generates SVG badges showing QA status for README and documentation.
 """
 
 import json
+import math
+import os
 import sys
-from pathlib import Path
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser
+    orjson = None
+
+def _load_json(path) -> Any:
+    """Parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Color scheme based on status
+STATUS_COLORS = {
+    "PASS": "#4c1",
+    "PASS_WITH_WARNINGS": "#fe7d37",
+    "FAIL": "#e05d44",
+    "ERROR": "#e05d44",
+    "UNKNOWN": "#9f9f9f"
+}
+
+# Badge message per status, formatted with the pass rate
+STATUS_BADGE_TEXT = {
+    "PASS": "passing ({pass_rate:.0%})",
+    "PASS_WITH_WARNINGS": "warnings ({pass_rate:.0%})",
+    "FAIL": "failing ({pass_rate:.0%})",
+    "ERROR": "error",
+    "UNKNOWN": "unknown"
+}
+
+# Advance widths in pixels of printable ASCII in 11px Verdana, the badge font
+GLYPH_WIDTHS = {
+    ' ': 3.87, '!': 4.33, '"': 5.05, '#': 9.00, '$': 7.00, '%': 11.84, '&': 8.00, "'": 2.96,
+    '(': 4.99, ')': 4.99, '*': 7.00, '+': 9.00, ',': 4.00, '-': 4.99, '.': 4.00, '/': 4.99,
+    '0': 7.00, '1': 7.00, '2': 7.00, '3': 7.00, '4': 7.00, '5': 7.00, '6': 7.00, '7': 7.00,
+    '8': 7.00, '9': 7.00, ':': 4.99, ';': 4.99, '<': 9.00, '=': 9.00, '>': 9.00, '?': 6.00,
+    '@': 11.00, 'A': 7.52, 'B': 7.55, 'C': 7.68, 'D': 8.48, 'E': 6.95, 'F': 6.33, 'G': 8.53,
+    'H': 8.26, 'I': 4.63, 'J': 5.00, 'K': 7.62, 'L': 6.13, 'M': 9.27, 'N': 8.23, 'O': 8.66,
+    'P': 6.63, 'Q': 8.66, 'R': 7.64, 'S': 7.52, 'T': 6.78, 'U': 8.05, 'V': 7.52, 'W': 10.88,
+    'X': 7.54, 'Y': 6.76, 'Z': 7.54, '[': 4.99, '\\': 4.99, ']': 4.99, '^': 9.00, '_': 7.00,
+    '`': 7.00, 'a': 6.61, 'b': 6.85, 'c': 5.73, 'd': 6.85, 'e': 6.56, 'f': 3.87, 'g': 6.85,
+    'h': 6.96, 'i': 3.01, 'j': 3.78, 'k': 6.51, 'l': 3.01, 'm': 10.70, 'n': 6.96, 'o': 6.68,
+    'p': 6.85, 'q': 6.85, 'r': 4.70, 's': 5.73, 't': 4.33, 'u': 6.96, 'v': 6.51, 'w': 9.00,
+    'x': 6.51, 'y': 6.51, 'z': 5.78, '{': 6.99, '|': 4.99, '}': 6.99, '~': 9.00
+}
+# Width assumed for characters outside the table
+DEFAULT_GLYPH_WIDTH = 7
+
+@lru_cache(maxsize=256)
+def _text_width(text: str) -> int:
+    """Approximate rendered width of text in pixels"""
+    return math.ceil(sum(GLYPH_WIDTHS.get(c, DEFAULT_GLYPH_WIDTH) for c in text))
+
+# The badge label is always "QA"; its width is fixed
+LABEL_WIDTH = _text_width("QA") + 10
+
+_BADGE_TEMPLATE = '''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="20" role="img" aria-label="QA: {badge_text}">
+    <title>QA: {badge_text}</title>
+    <linearGradient id="s" x2="0" y2="100%">
+        <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+        <stop offset="1" stop-opacity=".1"/>
+    </linearGradient>
+    <clipPath id="r">
+        <rect width="{total_width}" height="20" rx="3" fill="#fff"/>
+    </clipPath>
+    <g clip-path="url(#r)">
+        <rect width="{label_width}" height="20" fill="#555"/>
+        <rect x="{label_width}" width="{message_width}" height="20" fill="{color}"/>
+        <rect width="{total_width}" height="20" fill="url(#s)"/>
+    </g>
+    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
+        <text aria-hidden="true" x="{label_x}" y="15" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="20">QA</text>
+        <text x="{label_x}" y="14" transform="scale(.1)" fill="#fff" textLength="20">QA</text>
+        <text aria-hidden="true" x="{message_x}" y="15" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="{message_text_length}">{badge_text}</text>
+        <text x="{message_x}" y="14" transform="scale(.1)" fill="#fff" textLength="{message_text_length}">{badge_text}</text>
+    </g>
+</svg>'''
+
+def _scan_json(root: str) -> Iterator[str]:
+    """Recursively yield paths of QA report JSON files under root.
+    
+    Directories that cannot be opened are skipped, as rglob does.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_json(entry.path)
+            elif entry.name.endswith('.json') and 'qa-report' in entry.name and entry.is_file():
+                yield entry.path
 
 def load_latest_qa_report(reports_dir: str) -> Dict[str, Any]:
     """Load the most recent QA report"""
-    reports_path = Path(reports_dir)
-    
-    if not reports_path.exists():
+    if not os.path.isdir(reports_dir):
         return {}
     
     latest_report = None
     latest_time = ""
     
-    for report_file in reports_path.rglob("*.json"):
-        if "qa-report" in report_file.name:
-            try:
-                with open(report_file, 'r') as f:
-                    report = json.load(f)
-                    timestamp = report.get('timestamp', '')
-                    if timestamp > latest_time:
-                        latest_time = timestamp
-                        latest_report = report
-            except Exception:
-                continue
+    for report_file in _scan_json(reports_dir):
+        try:
+            report = _load_json(report_file)
+            timestamp = report.get('timestamp', '')
+            if timestamp > latest_time:
+                latest_time = timestamp
+                latest_report = report
+        except Exception:
+            continue
     
     return latest_report or {}
 
 def generate_badge_svg(status: str, pass_rate: float, message: str = "") -> str:
     """Generate SVG badge for QA status"""
     
-    # Color scheme based on status
-    colors = {
-        "PASS": "#4c1",
-        "PASS_WITH_WARNINGS": "#fe7d37",
-        "FAIL": "#e05d44",
-        "ERROR": "#e05d44",
-        "UNKNOWN": "#9f9f9f"
-    }
-    
-    color = colors.get(status, colors["UNKNOWN"])
+    color = STATUS_COLORS.get(status, STATUS_COLORS["UNKNOWN"])
     
     # Badge text
     if message:
         badge_text = message
     else:
-        if status == "PASS":
-            badge_text = f"passing ({pass_rate:.0%})"
-        elif status == "PASS_WITH_WARNINGS":
-            badge_text = f"warnings ({pass_rate:.0%})"
-        elif status == "FAIL":
-            badge_text = f"failing ({pass_rate:.0%})"
-        elif status == "ERROR":
-            badge_text = "error"
-        else:
-            badge_text = "unknown"
+        badge_text = STATUS_BADGE_TEXT.get(status, "unknown").format(pass_rate=pass_rate)
     
-    # Calculate text width (approximate)
-    label_width = len("QA") * 7 + 10
-    message_width = len(badge_text) * 7 + 10
-    total_width = label_width + message_width
-    
-    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="20" role="img" aria-label="QA: {badge_text}">
-    <title>QA: {badge_text}</title>
-    <linearGradient id="s" x2="0" y2="100%">
-        <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
-        <stop offset="1" stop-opacity=".1"/>
-    </linearGradient>
-    <clipPath id="r">
-        <rect width="{total_width}" height="20" rx="3" fill="#fff"/>
-    </clipPath>
-    <g clip-path="url(#r)">
-        <rect width="{label_width}" height="20" fill="#555"/>
-        <rect x="{label_width}" width="{message_width}" height="20" fill="{color}"/>
-        <rect width="{total_width}" height="20" fill="url(#s)"/>
-    </g>
-    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
-        <text aria-hidden="true" x="{label_width//2 + 5}" y="15" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="20">QA</text>
-        <text x="{label_width//2 + 5}" y="14" transform="scale(.1)" fill="#fff" textLength="20">QA</text>
-        <text aria-hidden="true" x="{label_width + message_width//2}" y="15" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="{(message_width-10)*10}">{badge_text}</text>
-        <text x="{label_width + message_width//2}" y="14" transform="scale(.1)" fill="#fff" textLength="{(message_width-10)*10}">{badge_text}</text>
-    </g>
-</svg>'''
+    # Calculate text width from per-glyph widths
+    message_width = _text_width(badge_text) + 10
     
-    return svg
+    return _BADGE_TEMPLATE.format_map({
+        "badge_text": badge_text,
+        "color": color,
+        "label_width": LABEL_WIDTH,
+        "message_width": message_width,
+        "total_width": LABEL_WIDTH + message_width,
+        "label_x": LABEL_WIDTH // 2 + 5,
+        "message_x": LABEL_WIDTH + message_width // 2,
+        "message_text_length": (message_width - 10) * 10
+    })
 
 def main():
     """Main entry point"""
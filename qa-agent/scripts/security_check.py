@@ -5,13 +5,149 @@ Security Check Script for CI/CD
 Performs security analysis on the Dattavani ASR codebase.
 """
 
+import itertools
 import json
+import mmap
+import re
 import subprocess
 import sys
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: the toml package has the same loads()
+    try:
+        import toml as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: stream cargo audit output instead of loading it whole
+    ijson = None
+
+# Patterns that suggest a hard-coded credential
+SECRETS_PATTERNS = [
+    r"password\s*=\s*['\"][^'\"]+['\"]",
+    r"api_key\s*=\s*['\"][^'\"]+['\"]",
+    r"secret\s*=\s*['\"][^'\"]+['\"]",
+    r"token\s*=\s*['\"][^'\"]+['\"]",
+    r"-----BEGIN.*PRIVATE KEY-----",
+]
+# One alternation so each file is scanned once; group N+1 is SECRETS_PATTERNS[N]
+SECRETS_RE = re.compile("|".join(f"({pattern})" for pattern in SECRETS_PATTERNS).encode(),
+                        re.IGNORECASE)
+# Lines that may open an unsafe block (the line must also contain "{")
+UNSAFE_LINE_RE = re.compile(rb"^.*unsafe.*$", re.MULTILINE)
+
+# (pattern index, matched text) and (line number, stripped line) hits for one file
+SourceHits = Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+# Window size for work done on slices of a mapped file, bounding the copies made
+SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def _count_newlines(mm: mmap.mmap, start: int, end: int) -> int:
+    """Count newlines in mm[start:end], copying at most SCAN_CHUNK_SIZE bytes at a time"""
+    count = 0
+    for offset in range(start, end, SCAN_CHUNK_SIZE):
+        count += mm[offset:min(offset + SCAN_CHUNK_SIZE, end)].count(b"\n")
+    return count
+
+
+def _print_json(obj: Any) -> None:
+    """Write obj to stdout as indented JSON, encoding with orjson when available"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.flush()
+    else:
+        print(json.dumps(obj, indent=2))
+
+
+def _scan_source(path: str) -> SourceHits:
+    """Scan one source file for secrets and unsafe blocks through a read-only mapping"""
+    secrets: List[Tuple[int, str]] = []
+    unsafe: List[Tuple[int, str]] = []
+    
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return secrets, unsafe
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                # Both passes run front to back: read ahead, and let pages go once used
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            for m in SECRETS_RE.finditer(mm):
+                secrets.append((m.lastindex - 1, _decode(m.group(0))))
+            
+            line_number, counted_to = 1, 0
+            for m in UNSAFE_LINE_RE.finditer(mm):
+                line = m.group(0)
+                if b"{" in line:
+                    line_number += _count_newlines(mm, counted_to, m.start())
+                    counted_to = m.start()
+                    unsafe.append((line_number, _decode(line.strip())))
+    
+    return secrets, unsafe
+
+
+def _try_scan_source(path: str) -> Optional[SourceHits]:
+    """_scan_source for worker processes: unreadable files yield None"""
+    try:
+        return _scan_source(path)
+    except Exception:
+        return None
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield regular files under root, each directory's files before its subdirectories"""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+        except OSError:
+            continue
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
+
+
+DEPENDENCY_TABLES = ("dependencies", "dev-dependencies", "build-dependencies")
+
+
+def _iter_dependency_specs(manifest: Dict[str, Any]) -> Iterator[Any]:
+    """Yield every dependency spec in a parsed Cargo.toml, including target and workspace tables"""
+    tables = [manifest, manifest.get("workspace", {})]
+    tables.extend(manifest.get("target", {}).values())
+    for table in tables:
+        for name in DEPENDENCY_TABLES:
+            yield from table.get(name, {}).values()
+
+
+# Below this many sources a process pool costs more to start than it saves
+PARALLEL_SCAN_MIN_FILES = 64
 
 class SecurityChecker:
     """Security analysis for Rust projects"""
@@ -19,6 +155,11 @@ class SecurityChecker:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.results = []
+        # Walked paths all start with the root string, so relative paths are a slice
+        self._root_str = os.fspath(self.project_root)
+        self._root_prefix_len = len(os.path.join(self._root_str, ""))
+        # Hits per Rust source, shared by the secrets and unsafe-code checks
+        self._source_hits: Optional[List[Tuple[str, SourceHits]]] = None
     
     def run_command(self, cmd: List[str]) -> tuple:
         """Run a command and return exit code, stdout, stderr"""
@@ -28,8 +169,58 @@ class SecurityChecker:
         except Exception as e:
             return -1, "", str(e)
     
+    def _stream_cargo_audit(self) -> Tuple[int, Optional[List[Dict[str, Any]]], int, str]:
+        """Run cargo audit and stream its JSON report through ijson.
+        
+        Only the first five vulnerabilities are kept; the rest are counted as
+        they go by. Returns exit code, those vulnerabilities (None if the report
+        could not be parsed), total count and stderr.
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                process = subprocess.Popen(["cargo", "audit", "--json"], stdout=subprocess.PIPE,
+                                           stderr=stderr_file, cwd=self.project_root)
+            except Exception as e:
+                return -1, [], 0, str(e)
+            
+            with process.stdout:
+                try:
+                    items = ijson.items(process.stdout, 'vulnerabilities.list.item', use_float=True)
+                    vulnerabilities = list(itertools.islice(items, 5))
+                    total = len(vulnerabilities) + sum(1 for _ in items)
+                except ijson.JSONError:
+                    vulnerabilities, total = None, 0
+                # Drain whatever the parser left so cargo can exit
+                while process.stdout.read(65536):
+                    pass
+            exit_code = process.wait()
+            
+            stderr_file.seek(0)
+            stderr = stderr_file.read(500).decode("utf-8", errors="replace")
+        return exit_code, vulnerabilities, total, stderr
+    
     def check_cargo_audit(self) -> Dict[str, Any]:
         """Run cargo audit for known vulnerabilities"""
+        if ijson is not None:
+            exit_code, vulnerabilities, total, stderr = self._stream_cargo_audit()
+            if exit_code != 0:
+                return {
+                    "status": "ERROR",
+                    "message": f"cargo audit failed with exit code {exit_code}",
+                    "error": stderr[:500]
+                }
+            if vulnerabilities is None:
+                return {
+                    "status": "ERROR",
+                    "message": "Could not parse cargo audit output"
+                }
+            return {
+                "status": "PASS" if total == 0 else "FAIL",
+                "vulnerabilities_found": total,
+                "vulnerabilities": vulnerabilities,  # First 5 only
+                "message": f"Found {total} known vulnerabilities"
+            }
+        
         exit_code, stdout, stderr = self.run_command(["cargo", "audit", "--json"])
         
         if exit_code == 0:
@@ -71,19 +262,33 @@ class SecurityChecker:
             with open(cargo_toml, 'r') as f:
                 content = f.read()
             
-            # Simple checks
             issues = []
             
+            if tomllib is not None:
+                git_deps = external_path_deps = wildcard_deps = False
+                for spec in _iter_dependency_specs(tomllib.loads(content)):
+                    if isinstance(spec, dict):
+                        git_deps = git_deps or "git" in spec
+                        external_path_deps = external_path_deps or ".." in Path(spec.get("path", "")).parts
+                        wildcard_deps = wildcard_deps or spec.get("version") == "*"
+                    else:
+                        wildcard_deps = wildcard_deps or spec == "*"
+            else:
+                # Simple checks
+                git_deps = "git =" in content
+                external_path_deps = "path =" in content and ".." in content
+                wildcard_deps = '"*"' in content
+            
             # Check for git dependencies (potential security risk)
-            if "git =" in content:
+            if git_deps:
                 issues.append("Git dependencies found (potential security risk)")
             
             # Check for path dependencies outside project
-            if "path =" in content and ".." in content:
+            if external_path_deps:
                 issues.append("External path dependencies found")
             
             # Check for wildcard versions
-            if '"*"' in content:
+            if wildcard_deps:
                 issues.append("Wildcard version dependencies found")
             
             return {
@@ -99,36 +304,41 @@ class SecurityChecker:
                 "message": f"Could not analyze dependencies: {str(e)}"
             }
     
+    def _scan_rust_sources(self) -> List[Tuple[str, SourceHits]]:
+        """Scan every Rust source once, keeping the files that had any hits"""
+        if self._source_hits is None:
+            rust_files = [entry.path for entry in _walk_files(self._root_str)
+                          if entry.name.endswith(".rs")]
+            results = None
+            if len(rust_files) >= PARALLEL_SCAN_MIN_FILES:
+                try:
+                    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                        results = list(executor.map(_try_scan_source, rust_files, chunksize=32))
+                except (OSError, RuntimeError):
+                    # No usable process pool here (e.g. restricted sandbox); scan inline
+                    results = None
+            if results is None:
+                results = [_try_scan_source(rust_file) for rust_file in rust_files]
+            
+            self._source_hits = [(rust_file, hits) for rust_file, hits in zip(rust_files, results)
+                                 if hits is not None and (hits[0] or hits[1])]
+        return self._source_hits
+    
     def check_secrets(self) -> Dict[str, Any]:
         """Check for potential secrets in code"""
-        secrets_patterns = [
-            r"password\s*=\s*['\"][^'\"]+['\"]",
-            r"api_key\s*=\s*['\"][^'\"]+['\"]",
-            r"secret\s*=\s*['\"][^'\"]+['\"]",
-            r"token\s*=\s*['\"][^'\"]+['\"]",
-            r"-----BEGIN.*PRIVATE KEY-----",
-        ]
-        
-        import re
-        
         secrets_found = []
         
         # Check Rust source files
-        for rust_file in self.project_root.rglob("*.rs"):
-            try:
-                with open(rust_file, 'r') as f:
-                    content = f.read()
-                
-                for pattern in secrets_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        secrets_found.append({
-                            "file": str(rust_file.relative_to(self.project_root)),
-                            "pattern": pattern,
-                            "match": match[:50] + "..." if len(match) > 50 else match
-                        })
-            except Exception:
+        for rust_file, (secret_hits, _) in self._scan_rust_sources():
+            if not secret_hits:
                 continue
+            relative_path = rust_file[self._root_prefix_len:]
+            for pattern_index, match in secret_hits:
+                secrets_found.append({
+                    "file": relative_path,
+                    "pattern": SECRETS_PATTERNS[pattern_index],
+                    "match": match[:50] + "..." if len(match) > 50 else match
+                })
         
         return {
             "status": "PASS" if len(secrets_found) == 0 else "FAIL",
@@ -141,20 +351,16 @@ class SecurityChecker:
         """Check for unsafe Rust code blocks"""
         unsafe_blocks = []
         
-        for rust_file in self.project_root.rglob("*.rs"):
-            try:
-                with open(rust_file, 'r') as f:
-                    lines = f.readlines()
-                
-                for i, line in enumerate(lines):
-                    if "unsafe" in line and "{" in line:
-                        unsafe_blocks.append({
-                            "file": str(rust_file.relative_to(self.project_root)),
-                            "line": i + 1,
-                            "code": line.strip()
-                        })
-            except Exception:
+        for rust_file, (_, unsafe_hits) in self._scan_rust_sources():
+            if not unsafe_hits:
                 continue
+            relative_path = rust_file[self._root_prefix_len:]
+            for line_number, code in unsafe_hits:
+                unsafe_blocks.append({
+                    "file": relative_path,
+                    "line": line_number,
+                    "code": code
+                })
         
         return {
             "status": "PASS" if len(unsafe_blocks) == 0 else "WARN",
@@ -173,21 +379,20 @@ class SecurityChecker:
         
         suspicious_files = []
         
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file():
-                try:
-                    stat = file_path.stat()
-                    mode = oct(stat.st_mode)[-3:]
-                    
-                    # Check for world-writable files
-                    if mode.endswith('6') or mode.endswith('7'):
-                        suspicious_files.append({
-                            "file": str(file_path.relative_to(self.project_root)),
-                            "permissions": mode,
-                            "issue": "World-writable file"
-                        })
-                except Exception:
-                    continue
+        for entry in _walk_files(self._root_str):
+            try:
+                # DirEntry caches the lstat, so this is at most one syscall per file
+                mode = entry.stat(follow_symlinks=False).st_mode & 0o777
+            except OSError:
+                continue
+            
+            # Check for world-writable files
+            if mode & 0o002:
+                suspicious_files.append({
+                    "file": entry.path[self._root_prefix_len:],
+                    "permissions": f"{mode:03o}",
+                    "issue": "World-writable file"
+                })
         
         return {
             "status": "PASS" if len(suspicious_files) == 0 else "WARN",
@@ -251,7 +456,7 @@ def main():
     checker = SecurityChecker(project_root)
     results = checker.run_all_checks()
     
-    print(json.dumps(results, indent=2))
+    _print_json(results)
     
     # Exit with appropriate code
     exit_code = 0 if results["overall_status"] in ["PASS", "WARN"] else 1